@@ -1,4 +1,7 @@
-from functools import wraps
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 
 from django.forms.boundfield import BoundField
 from django.template import Library, TemplateSyntaxError
@@ -9,31 +12,109 @@ register = Library()
 NUMERIC_KEYS = frozenset(["min", "max", "step", "size", "minlength", "maxlength", "cols", "rows"])
 INTEGER_KEYS = frozenset(["size", "minlength", "maxlength", "cols", "rows"])
 
+# Maps each numeric attribute to the type its value is coerced to.
+_NUMERIC_COERCERS = {key: int if key in INTEGER_KEYS else float for key in NUMERIC_KEYS}
 
-def boundfield_required(func):
+# Sentinel for attributes that are not set on the widget.
+_MISSING = object()
+
+# Placeholder for escaped commas while splitting; NUL does not occur in attribute strings.
+_ESCAPED_COMMA_SENTINEL = "\x00"
+# Matches any run of commas and/or whitespace between class names.
+_CLASS_SPLIT_RE = re.compile(r"[,\s]+")
+
+
+def split_attributes(s):
+    """
+    Splits an attribute string on unescaped commas.
+
+    A comma preceded by a backslash ('\\,') is kept as a literal comma in the
+    resulting part instead of being treated as a delimiter.
     """
-    Decorator to ensure that the provided value is a BoundField instance."
+    if "\\" not in s:
+        # Fast path: without escapes a plain split is equivalent.
+        parts = s.split(",")
+    else:
+        # Hide escaped commas behind a sentinel, split, then restore them.
+        parts = [
+            part.replace(_ESCAPED_COMMA_SENTINEL, ",")
+            for part in s.replace("\\,", _ESCAPED_COMMA_SENTINEL).split(",")
+        ]
 
-    This decorator is used to validate that the input to a template filter
-    is a BoundField instance, raising a TypeError if it is not.
+    # A trailing delimiter does not produce an empty attribute.
+    if not parts[-1]:
+        parts.pop()
 
-    Usage:
-    @boundfield_required
-    def your_filter(value, arg):
-        ...
+    return parts
+
+
+def _parse_attribute(attribute: str) -> tuple[str, object]:
     """
-    @wraps(func)
-    def wrapper(value, *args, **kwargs):
-        if not isinstance(value, BoundField):
-            raise TypeError(
-                f"The '{func.__name__}' filter can only be applied to form fields (BoundField instances)."
-            )
-        return func(value, *args, **kwargs)
-    return wrapper
+    Parses a single 'key=value' (or bare 'key') token into a (key, value) pair.
+    """
+    attribute = attribute.strip()
+    key, separator, val = attribute.partition("=")
+    if separator:
+        # Interned keys hit the identity fast path in set and dict lookups
+        key = sys.intern(key.strip())
+        val = val.strip()
+
+        # Handle numeric attributes
+        coerce = _NUMERIC_COERCERS.get(key)
+        if coerce is not None:
+            try:
+                val = coerce(val)
+            except ValueError:
+                expected_type = "integer" if coerce is int else "floating-point"
+                raise TemplateSyntaxError(
+                    f"The value '{val}' for '{key}' attribute must be a valid {expected_type}."
+                )
+        return key, val
+
+    # Set attribute with an empty string value if no value is provided
+    return sys.intern(attribute), ""
+
+
+@lru_cache(maxsize=1024)
+def _parse_set_attr(spec: str) -> MappingProxyType[str, object]:
+    """
+    Parses a 'set_attr' argument into a read-only mapping of attributes.
+
+    Numeric attributes are coerced to int/float here, so each unique argument
+    string is parsed and validated only once per process. The mapping is shared
+    between calls, hence read-only.
+    """
+    if "," not in spec and "\\" not in spec:
+        # Fast path: a single attribute needs no splitting at all.
+        return MappingProxyType(dict([_parse_attribute(spec)]) if spec else {})
+
+    return MappingProxyType(dict(_parse_attribute(attribute) for attribute in split_attributes(spec)))
+
+
+@lru_cache(maxsize=1024)
+def _parse_attr_names(spec: str) -> tuple[str, ...]:
+    """Parses a comma-separated 'clear_attr' argument into attribute names."""
+    return tuple(attr_name.strip() for attr_name in spec.split(","))
+
+
+@lru_cache(maxsize=1024)
+def _parse_classes(spec: str) -> tuple[str, ...]:
+    """Parses a comma- and/or space-separated class argument into class names."""
+    return tuple(class_name for class_name in _CLASS_SPLIT_RE.split(spec) if class_name)
+
+
+@lru_cache(maxsize=1024)
+def _parse_class_attr(class_string: str) -> tuple[str, ...]:
+    """
+    Splits an existing 'class' attribute value into unique class names.
+
+    Widgets keep the same class string between renders, so this is cached by
+    value rather than stored on the widget, whose attrs are rendered as HTML.
+    """
+    return tuple(dict.fromkeys(class_string.split()))
 
 
 @register.filter(name="set_attr")
-@boundfield_required
 def set_attr(value: BoundField, attributes_string: str) -> BoundField:
     """
     Adds or updates HTML attributes for a Django form field widget dynamically.
@@ -72,66 +153,31 @@ def set_attr(value: BoundField, attributes_string: str) -> BoundField:
     TypeError: If the input is not a BoundField instance.
     TemplateSyntaxError: If the attribute format is invalid or cannot be parsed correctly.
     """
-    def split_attributes(s):
-        parts = []
-        current = ""
-        escape_char = "\\"
-        delimiter = ","
-
-        i = 0
-        while i < len(s):
-            char = s[i]
-
-            # If the character is a delimiter and either `current` is empty or 
-            # the last added character is not an escape character,
-            # append the accumulated characters in `current` to `parts` and clear `current`.
-            if char == delimiter and (not current or current[-1] != escape_char):
-                parts.append(current)
-                current = ""
-            # If the character is an escape character and the next character is a delimiter,
-            # append the delimiter to `current` and skip the next character.
-            elif char == escape_char and i + 1 < len(s) and s[i + 1] == delimiter:
-                current += delimiter
-                i += 1
-            else:
-                current += char
-            i += 1
-
-        # Append any remaining characters in `current` to `parts`.
-        if current:
-            parts.append(current)
-
-        return parts
+    # Only form fields are supported. This check is repeated inline in each filter
+    # rather than done by a decorator, to avoid a wrapper call per render.
+    if type(value) is not BoundField and not isinstance(value, BoundField):
+        raise TypeError(
+            "The 'set_attr' filter can only be applied to form fields (BoundField instances)."
+        )
 
     attrs = value.field.widget.attrs
 
-    for attribute in split_attributes(attributes_string):
-        attribute = attribute.strip()
-        if "=" in attribute:
-            key, val = attribute.split("=", 1)
-            key = key.strip()
-            val = val.strip()
-
-            # Handle numeric attributes
-            if key in NUMERIC_KEYS:
-                try:
-                    attrs[key] = int(val) if key in INTEGER_KEYS else float(val)
-                except ValueError:
-                    expected_type = "integer" if key in INTEGER_KEYS else "floating-point"
-                    raise TemplateSyntaxError(
-                        f"The value '{val}' for '{key}' attribute must be a valid {expected_type}."
-                    )
-            else:
-                attrs[key] = val
-        else:
-            # Set attribute with an empty string value if no value is provided
-            attrs[attribute] = ""
+    new_attrs = {}
+
+    # Collect only the attributes whose value actually changes
+    for key, val in _parse_set_attr(attributes_string).items():
+        existing = attrs.get(key, _MISSING)
+        if existing != val or type(existing) is not type(val):
+            new_attrs[key] = val
+
+    # Apply them in a single update
+    if new_attrs:
+        attrs.update(new_attrs)
 
     return value
 
 
 @register.filter(name="clear_attr")
-@boundfield_required
 def clear_attr(value: BoundField, attr_names: str) -> BoundField:
     """
     Removes specified HTML attributes from a Django form field widget.
@@ -157,11 +203,14 @@ def clear_attr(value: BoundField, attr_names: str) -> BoundField:
     Raises:
     TypeError: If the input is not a BoundField instance.
     """
-    attrs = value.field.widget.attrs
+    if type(value) is not BoundField and not isinstance(value, BoundField):
+        raise TypeError(
+            "The 'clear_attr' filter can only be applied to form fields (BoundField instances)."
+        )
 
-    for attr_name in attr_names.split(","):
-        attr_name = attr_name.strip()
+    attrs = value.field.widget.attrs
 
+    for attr_name in _parse_attr_names(attr_names):
         # Check if the attribute exists and remove it
         if attr_name in attrs:
             del attrs[attr_name]
@@ -170,7 +219,6 @@ def clear_attr(value: BoundField, attr_names: str) -> BoundField:
 
 
 @register.filter(name="append_class")
-@boundfield_required
 def append_class(value: BoundField, new_classes: str) -> BoundField:
     """
     Appends CSS classes to the 'class' attribute of a Django form field widget.
@@ -198,25 +246,40 @@ def append_class(value: BoundField, new_classes: str) -> BoundField:
     Raises:
     TypeError: If the input is not a BoundField instance.
     """
-    attrs = value.field.widget.attrs
-    current_classes = set(attrs.get("class", "").split())
-
-    # Split new classes based on commas and spaces, then add them if not already present
-    for class_set in new_classes.split(","):
-        for class_name in class_set.split():
-            stripped_class_name = class_name.strip()
-            if stripped_class_name:
-                current_classes.add(stripped_class_name)
+    if type(value) is not BoundField and not isinstance(value, BoundField):
+        raise TypeError(
+            "The 'append_class' filter can only be applied to form fields (BoundField instances)."
+        )
 
-    # Update the 'class' attribute with the modified list
-    if current_classes:
+    attrs = value.field.widget.attrs
+    existing_classes = attrs.get("class", "")
+    existing_class_names = _parse_class_attr(existing_classes)
+    class_names = _parse_classes(new_classes)
+
+    # Fast path: append a single class without rebuilding the class list
+    if len(class_names) == 1:
+        class_name = class_names[0]
+        if class_name not in existing_class_names:
+            attrs["class"] = " ".join((*existing_class_names, class_name))
+        return value
+
+    # An insertion-ordered dict keeps the rendered class order deterministic
+    current_classes = dict.fromkeys(existing_class_names)
+    class_count = len(current_classes)
+
+    # Add new classes in the given order if not already present
+    for class_name in class_names:
+        if class_name not in current_classes:
+            current_classes[class_name] = None
+
+    # Update the 'class' attribute only if any class was added
+    if len(current_classes) != class_count:
         attrs["class"] = " ".join(current_classes)
 
     return value
 
 
 @register.filter(name="remove_class")
-@boundfield_required
 def remove_class(value: BoundField, class_names: str) -> BoundField:
     """
     Removes specified CSS classes from the 'class' attribute of a Django form field widget.
@@ -246,20 +309,27 @@ def remove_class(value: BoundField, class_names: str) -> BoundField:
     Raises:
     TypeError: If the input is not a BoundField instance.
     """
+    if type(value) is not BoundField and not isinstance(value, BoundField):
+        raise TypeError(
+            "The 'remove_class' filter can only be applied to form fields (BoundField instances)."
+        )
+
     attrs = value.field.widget.attrs
-    current_classes = set(attrs.get("class", "").split())
+    existing_classes = attrs.get("class", "")
+    current_classes = dict.fromkeys(_parse_class_attr(existing_classes))
+    class_count = len(current_classes)
+
+    # Remove the given classes if present, preserving the order of the rest
+    for class_name in _parse_classes(class_names):
+        current_classes.pop(class_name, None)
 
-    # Split class names based on commas and spaces, then remove them if present
-    for class_set in class_names.split(","):
-        for class_name in class_set.split():
-            stripped_class_name = class_name.strip()
-            if stripped_class_name in current_classes:
-                current_classes.remove(stripped_class_name)
+    # Remove the 'class' attribute entirely if no classes are left
+    if not current_classes:
+        attrs.pop("class", None)
+        return value
 
-    # Update the 'class' attribute with the modified list or remove it if empty
-    if current_classes:
+    # Update the 'class' attribute only if any class was removed
+    if len(current_classes) != class_count:
         attrs["class"] = " ".join(current_classes)
-    elif "class" in attrs:
-        del attrs["class"]
 
     return value
\ No newline at end of file
@@ -1,3 +1,126 @@
-from django.test import TestCase
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .forms import SampleForm
+from .templatetags.field_attrs import (
+    append_class,
+    clear_attr,
+    remove_class,
+    set_attr,
+    split_attributes,
+)
+
+
+class SplitAttributesTests(SimpleTestCase):
+    def test_escaped_comma_stays_in_one_attribute(self):
+        self.assertEqual(split_attributes(r"a\,b"), ["a,b"])
+
+    def test_escaped_comma_after_backslash(self):
+        self.assertEqual(split_attributes(r"a\\,b"), ["a\\,b"])
+
+    def test_trailing_comma_is_dropped(self):
+        self.assertEqual(split_attributes("a,"), ["a"])
+
+    def test_doubled_comma_keeps_empty_part(self):
+        self.assertEqual(split_attributes("a,,b"), ["a", "", "b"])
+
+    def test_empty_string(self):
+        self.assertEqual(split_attributes(""), [])
+
+
+class SetAttrTests(SimpleTestCase):
+    def setUp(self):
+        self.form = SampleForm()
+
+    def attrs(self, name):
+        return self.form.fields[name].widget.attrs
+
+    def test_sets_multiple_attributes(self):
+        set_attr(self.form["email"], "class=form-control,placeholder=Email Address")
+        self.assertEqual(self.attrs("email")["class"], "form-control")
+        self.assertEqual(self.attrs("email")["placeholder"], "Email Address")
+
+    def test_escaped_comma_in_value(self):
+        set_attr(self.form["email"], r"placeholder=Email Address\, Username")
+        self.assertEqual(self.attrs("email")["placeholder"], "Email Address, Username")
+
+    def test_bare_attribute_gets_empty_value(self):
+        set_attr(self.form["email"], "required")
+        self.assertEqual(self.attrs("email")["required"], "")
+
+    def test_integer_and_float_coercion(self):
+        set_attr(self.form["age"], "size=3,min=0,max=20")
+        self.assertEqual(self.attrs("age")["size"], 3)
+        self.assertIs(type(self.attrs("age")["size"]), int)
+        self.assertEqual(self.attrs("age")["min"], 0.0)
+        self.assertIs(type(self.attrs("age")["min"]), float)
+
+    def test_invalid_integer_raises(self):
+        with self.assertRaisesMessage(
+            TemplateSyntaxError, "The value '1.5' for 'size' attribute must be a valid integer."
+        ):
+            set_attr(self.form["age"], "size=1.5")
+
+    def test_invalid_float_raises_without_touching_widget(self):
+        with self.assertRaisesMessage(
+            TemplateSyntaxError, "The value 'abc' for 'min' attribute must be a valid floating-point."
+        ):
+            set_attr(self.form["age"], "class=x,min=abc")
+        self.assertEqual(self.attrs("age")["class"], "test-age")
+
+    def test_rejects_non_boundfield(self):
+        with self.assertRaisesMessage(TypeError, "The 'set_attr' filter can only be applied"):
+            set_attr("not a field", "class=x")
+
+
+class ClearAttrTests(SimpleTestCase):
+    def test_removes_attributes(self):
+        form = SampleForm()
+        clear_attr(form["first_name"], "class, placeholder")
+        self.assertEqual(form.fields["first_name"].widget.attrs, {})
+
+
+class ClassFilterTests(SimpleTestCase):
+    def setUp(self):
+        self.form = SampleForm()
+        self.attrs = self.form.fields["email"].widget.attrs
+
+    def test_append_class_keeps_order_and_dedups(self):
+        append_class(self.form["email"], "b a,b test-email")
+        self.assertEqual(self.attrs["class"], "test-email b a")
+
+    def test_append_single_class_normalizes_existing(self):
+        self.attrs["class"] = " a  a "
+        append_class(self.form["email"], "c")
+        self.assertEqual(self.attrs["class"], "a c")
+
+    def test_append_existing_class_is_noop(self):
+        append_class(self.form["email"], "test-email")
+        self.assertEqual(self.attrs["class"], "test-email")
+
+    def test_remove_class_keeps_order(self):
+        self.attrs["class"] = "a b c d"
+        remove_class(self.form["email"], "b,d")
+        self.assertEqual(self.attrs["class"], "a c")
+
+    def test_remove_class_deletes_empty_attribute(self):
+        remove_class(self.form["email"], "test-email")
+        self.assertNotIn("class", self.attrs)
+
+    def test_remove_class_deletes_blank_attribute(self):
+        for blank in ("", "  "):
+            with self.subTest(blank=blank):
+                self.attrs["class"] = blank
+                remove_class(self.form["email"], "missing")
+                self.assertNotIn("class", self.attrs)
+
+
+class TemplateRenderingTests(SimpleTestCase):
+    def test_filters_in_template(self):
+        form = SampleForm()
+        rendered = Template(
+            "{% load field_attrs %}"
+            '{{ form.email|append_class:"form-control"|set_attr:"placeholder=Email" }}'
+        ).render(Context({"form": form}))
+        self.assertIn('class="test-email form-control"', rendered)
+        self.assertIn('placeholder="Email"', rendered)
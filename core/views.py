@@ -5,10 +5,10 @@ from .forms import SampleForm
 # Create your views here.
 
 def index_view(request):
-    form = SampleForm()
-
     if request.method == "POST":
         form = SampleForm(request.POST)
+    else:
+        form = SampleForm()
 
     context = {
         "form": form